@@ -2,7 +2,10 @@ import re
 import shutil
 from dataclasses import dataclass, field
 from os import path
-from typing import Any
+from typing import Any, Tuple
+
+# parsed autoexec.cfg per installation, only re-read if the file was modified
+_cache: dict[str, Tuple[float, 'Autoexec']] = {}
 
 
 @dataclass
@@ -12,7 +15,7 @@ class Autoexec:
     values: dict = field(init=False, default_factory=dict)
 
     def __post_init__(self):
-        file = path.expandvars(self.bot.config[self.installation]['DCS_HOME']) + r'\Config\autoexec.cfg'
+        file = self.get_path(self.bot, self.installation)
         if not path.exists(file):
             return
         exp = re.compile('(?P<key>.*)=(?P<value>.*)')
@@ -63,6 +66,19 @@ class Autoexec:
             self.values[key] = value
             self.update()
 
+    @staticmethod
+    def get_path(bot: Any, installation: str) -> str:
+        return path.expandvars(bot.config[installation]['DCS_HOME']) + r'\Config\autoexec.cfg'
+
+    @classmethod
+    def cached(cls, bot: Any, installation: str) -> 'Autoexec':
+        file = cls.get_path(bot, installation)
+        mtime = path.getmtime(file) if path.exists(file) else 0
+        entry = _cache.get(installation)
+        if not entry or entry[0] != mtime:
+            entry = _cache[installation] = (mtime, cls(bot=bot, installation=installation))
+        return entry[1]
+
     @staticmethod
     def parse(value: str) -> Any:
         if value.startswith('"'):
@@ -87,7 +103,7 @@ class Autoexec:
             return value
 
     def update(self):
-        outfile = path.expandvars(self.bot.config[self.installation]['DCS_HOME']) + r'\Config\autoexec.cfg'
+        outfile = self.get_path(self.bot, self.installation)
         if path.exists(outfile):
             shutil.copy(outfile, outfile + '.bak')
         with open(outfile, 'w') as outcfg:
@@ -1,7 +1,6 @@
 import asyncio
-import concurrent
 import discord
-import json
+import orjson
 import platform
 import psycopg2
 import re
@@ -12,11 +11,11 @@ from copy import deepcopy
 from core import utils, Server, Status, Channel, DataObjectFactory, Player, Autoexec
 from datetime import datetime
 from discord.ext import commands
-from queue import Queue
-from socketserver import BaseRequestHandler, ThreadingUDPServer
-from typing import Callable, Optional, Tuple, Union
+from typing import Optional, Tuple, Union
 from .listener import EventListener
 
+MAX_PARALLEL_REGISTRATIONS = 8
+
 
 class DCSServerBot(commands.Bot):
 
@@ -28,7 +27,14 @@ class DCSServerBot(commands.Bot):
         self.listeners = {}
         self.eventListeners: list[EventListener] = []
         self.external_ip: Optional[str] = None
+        self.agent_host: str = platform.node()
         self.udp_server = None
+        # one socket is shared for all outgoing messages to DCS
+        self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # on Windows, an ICMP port unreachable from a stopped server would otherwise fail a later sendto() to any
+        # other server with WSAECONNRESET
+        if hasattr(socket, 'SIO_UDP_CONNRESET'):
+            self.udp_socket.ioctl(socket.SIO_UDP_CONNRESET, False)
         self.servers: dict[str, Server] = dict()
         self.pool = kwargs['pool']
         self.log = kwargs['log']
@@ -49,21 +55,23 @@ class DCSServerBot(commands.Bot):
         self.mission_stats = None
         self.synced: bool = not self.master
         self.tree.on_error = self.on_app_command_error
-        self.executor = ThreadPoolExecutor(thread_name_prefix='BotExecutor', max_workers=20)
+        # if not configured, use the same size as asyncio's default executor (min(32, cpu_count + 4))
+        max_workers = int(self.config['BOT']['THREAD_POOL_SIZE']) if 'THREAD_POOL_SIZE' in self.config['BOT'] else None
+        self.executor = ThreadPoolExecutor(thread_name_prefix='BotExecutor', max_workers=max_workers)
 
     async def close(self):
         await self.audit(message="DCSServerBot stopped.")
         self.log.info('Graceful shutdown ...')
         if self.udp_server:
             self.log.debug("- Processing unprocessed messages ...")
-            await asyncio.to_thread(self.udp_server.shutdown)
+            await self.udp_server.shutdown()
             self.log.debug("- All messages processed.")
-            self.udp_server.server_close()
         self.log.debug('- Listener stopped.')
-        self.executor.shutdown(wait=True)
-        self.log.debug('- Executor stopped.')
+        self.udp_socket.close()
         self.log.info('- Unloading Plugins ...')
         await super().close()
+        self.executor.shutdown(wait=True)
+        self.log.debug('- Executor stopped.')
         self.log.info('Shutdown complete.')
 
     def is_master(self) -> bool:
@@ -83,18 +91,29 @@ class DCSServerBot(commands.Bot):
     async def register_servers(self):
         self.log.info('- Searching for running DCS servers (this might take a bit) ...')
         servers = list(self.servers.values())
-        timeout = (5 * len(self.servers)) if self.config.getboolean('BOT', 'SLOW_SYSTEM') else (3 * len(self.servers))
-        ret = await asyncio.gather(
-            *[server.sendtoDCSSync({"command": "registerDCSServer"}, timeout) for server in servers],
-            return_exceptions=True
-        )
+        # don't contact too many servers at once, the timeout scales with the number of parallel registrations
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_REGISTRATIONS)
+        num_parallel = min(len(servers), MAX_PARALLEL_REGISTRATIONS)
+        timeout = (5 * num_parallel) if self.config.getboolean('BOT', 'SLOW_SYSTEM') else (3 * num_parallel)
+
+        async def register(server: Server) -> bool:
+            async with semaphore:
+                try:
+                    await server.sendtoDCSSync({"command": "registerDCSServer"}, timeout)
+                except asyncio.TimeoutError:
+                    server.status = Status.SHUTDOWN
+                    self.log.debug(f'  => Timeout while trying to contact DCS server "{server.name}".')
+                    return False
+                except Exception as ex:
+                    self.log.exception(ex)
+                    return False
+            # log each server as soon as it answered, not when the slowest one timed out
+            self.log.info(f'  => Running DCS server "{server.name}" registered.')
+            return True
+
         num = 0
-        for i in range(0, len(servers)):
-            if isinstance(ret[i], asyncio.TimeoutError):
-                servers[i].status = Status.SHUTDOWN
-                self.log.debug(f'  => Timeout while trying to contact DCS server "{servers[i].name}".')
-            else:
-                self.log.info(f'  => Running DCS server "{servers[i].name}" registered.')
+        for result in asyncio.as_completed([register(server) for server in servers]):
+            if await result:
                 num += 1
         if num == 0:
             self.log.info('- No running servers found.')
@@ -133,6 +152,8 @@ class DCSServerBot(commands.Bot):
         await self.load_plugin(plugin)
 
     async def start(self, token: str, *, reconnect: bool = True) -> None:
+        # all blocking calls offloaded with asyncio.to_thread() share the bot's thread pool
+        asyncio.get_running_loop().set_default_executor(self.executor)
         self.init_servers()
         await super().start(token, reconnect=reconnect)
 
@@ -207,6 +228,7 @@ class DCSServerBot(commands.Bot):
                     if self.config.getboolean(server.installation, 'COALITIONS'):
                         self.check_roles(['Coalition Red', 'Coalition Blue'], server)
                     self.check_channels(server.installation)
+                    server.resolve_channels()
                 self.log.info('- Loading Plugins ...')
                 for plugin in self.plugins:
                     if not await self.load_plugin(plugin.lower()):
@@ -276,7 +298,7 @@ class DCSServerBot(commands.Bot):
                 self.audit_channel = self.get_channel(int(self.config['BOT']['AUDIT_CHANNEL']))
         if self.audit_channel:
             if isinstance(user, str):
-                member = self.get_member_by_ucid(user)
+                member = await asyncio.to_thread(self.get_member_by_ucid, user)
             else:
                 member = user
             embed = discord.Embed(color=discord.Color.blue())
@@ -298,14 +320,16 @@ class DCSServerBot(commands.Bot):
 
     def sendtoBot(self, message: dict):
         message['channel'] = '-1'
-        msg = json.dumps(message)
-        self.log.debug('HOST->HOST: {}'.format(msg))
-        dcs_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        msg = orjson.dumps(message)
+        self.log.debug('HOST->HOST: {}'.format(msg.decode('utf-8')))
         host = self.config['BOT']['HOST']
         if host == '0.0.0.0':
             host = '127.0.0.1'
-        dcs_socket.sendto(msg.encode('utf-8'), (host, int(self.config['BOT']['PORT'])))
-        dcs_socket.close()
+        self.udp_socket.sendto(msg, (host, int(self.config['BOT']['PORT'])))
+
+    def get_ports(self, server: Server) -> Tuple[int, int, int]:
+        autoexec = Autoexec.cached(self, server.installation)
+        return int(server.settings.get('port', 10308)), autoexec.webgui_port or 8088, autoexec.webrtc_port or 10309
 
     def get_channel(self, channel_id: int):
         return super().get_channel(channel_id) if channel_id != -1 else None
@@ -491,18 +515,24 @@ class DCSServerBot(commands.Bot):
         else:
             max_weight = 0
             best_fit = None
+            name = re.sub(tag_filter, '', data.name).strip() if tag_filter else data.name
+            if data.display_name:
+                nickname = re.sub(tag_filter, '', data.display_name).strip() if tag_filter else data.display_name
+            else:
+                nickname = None
             conn = self.pool.getconn()
             try:
-                with closing(conn.cursor()) as cursor:
+                # stream the players through a server-side cursor instead of loading the whole table at once
+                with closing(conn.cursor(name='match_user')) as cursor:
                     sql = 'SELECT ucid, name from players'
                     if rematch is False:
                         sql += ' WHERE discord_id = -1 AND name IS NOT NULL'
                     cursor.execute(sql)
-                    for row in cursor.fetchall():
-                        name = re.sub(tag_filter, '', data.name).strip() if tag_filter else data.name
-                        if data.display_name:
-                            nickname = re.sub(tag_filter, '', data.display_name).strip() if tag_filter else data.display_name
-                            weight = max(self.match(nickname, row['name']), self.match(name, row['name']))
+                    for row in cursor:
+                        if not row[1]:
+                            continue
+                        if nickname:
+                            weight = max(self.match(nickname, row[1]), self.match(name, row[1]))
                         else:
                             weight = self.match(name, row[1])
                         if weight > max_weight:
@@ -550,11 +580,12 @@ class DCSServerBot(commands.Bot):
                 DataObjectFactory().new(Server.__name__, bot=self, name=data['server_name'],
                                         installation=installation, host=self.config[installation]['DCS_HOST'],
                                         port=self.config[installation]['DCS_PORT'])
-        # set the PID
-        for exe in ['DCS_server.exe', 'DCS.exe']:
-            server.process = utils.find_process(exe, server.installation)
-            if server.process:
-                break
+        # set the PID, only scan the process list if we don't know a running process already
+        if not server.process or not server.process.is_running():
+            for exe in ['DCS_server.exe', 'DCS.exe']:
+                server.process = utils.find_process(exe, server.installation)
+                if server.process:
+                    break
         server.dcs_version = data['dcs_version']
         if data['channel'].startswith('sync-'):
             if 'players' not in data:
@@ -563,48 +594,57 @@ class DCSServerBot(commands.Bot):
                 server.status = Status.PAUSED
             else:
                 server.status = Status.RUNNING
-        # validate server ports
-        dcs_ports: dict[int, str] = dict()
-        webgui_ports: dict[int, str] = dict()
-        webrtc_ports: dict[int, str] = dict()
-        for server in self.servers.values():
-            if server.status in [Status.UNREGISTERED, Status.SHUTDOWN]:
+        # validate the server ports against the other running servers
+        dcs_port, webgui_port, webrtc_port = self.get_ports(server)
+        for other in self.servers.values():
+            if other is server or other.status in [Status.UNREGISTERED, Status.SHUTDOWN]:
                 continue
-            dcs_port = int(server.settings.get('port', 10308))
-            if dcs_port in dcs_ports:
+            other_dcs_port, other_webgui_port, other_webrtc_port = self.get_ports(other)
+            if dcs_port == other_dcs_port:
                 self.log.error(f'Server "{server.name}" shares its DCS port with server '
-                               f'"{dcs_ports[dcs_port]}"! Registration aborted.')
+                               f'"{other.name}"! Registration aborted.')
                 return False
-            else:
-                dcs_ports[dcs_port] = server.name
-            autoexec = Autoexec(bot=self, installation=server.installation)
-            webgui_port = autoexec.webgui_port or 8088
-            if webgui_port in webgui_ports:
+            if webgui_port == other_webgui_port:
                 self.log.error(f'Server "{server.name}" shares its webgui_port with server '
-                               f'"{webgui_ports[webgui_port]}"! Registration aborted.')
+                               f'"{other.name}"! Registration aborted.')
                 return False
-            else:
-                webgui_ports[webgui_port] = server.name
-            webrtc_port = autoexec.webrtc_port or 10309
-            if webrtc_port in webrtc_ports:
+            if webrtc_port == other_webrtc_port:
                 if server.settings['advanced'].get('voice_chat_server', False):
                     self.log.error(f'Server "{server.name}" shares its webrtc_port port with server '
-                                   f'"{webrtc_ports[webrtc_port]}"! Registration aborted.')
+                                   f'"{other.name}"! Registration aborted.')
                 else:
                     self.log.warning(f'Server "{server.name}" shares its webrtc_port port with server '
-                                     f'"{webrtc_ports[webrtc_port]}", but voice chat is disabled.')
-            else:
-                webrtc_ports[webrtc_port] = server.name
+                                     f'"{other.name}", but voice chat is disabled.')
 
         # update the database and check for server name changes
         conn = self.pool.getconn()
         try:
             with closing(conn.cursor(cursor_factory=psycopg2.extras.DictCursor)) as cursor:
-                cursor.execute('SELECT server_name FROM servers WHERE agent_host=%s AND host=%s AND port=%s',
-                               (platform.node(), data['host'], data['port']))
-                if cursor.rowcount == 1:
-                    server_name = cursor.fetchone()[0]
-                    if server_name != data['server_name']:
+                params = {
+                    "server_name": data['server_name'],
+                    "agent_host": self.agent_host,
+                    "host": data['host'],
+                    "port": data['port']
+                }
+                # read the server name that is registered for this port and upsert our server in one go, unless the
+                # name has changed (rename or port conflict), which needs to be handled first
+                cursor.execute("""
+                    WITH old AS (
+                        SELECT server_name FROM servers 
+                        WHERE agent_host = %(agent_host)s AND host = %(host)s AND port = %(port)s
+                    ), upsert AS (
+                        INSERT INTO servers (server_name, agent_host, host, port) 
+                        SELECT %(server_name)s, %(agent_host)s, %(host)s, %(port)s::BIGINT
+                        WHERE NOT EXISTS (SELECT 1 FROM old WHERE server_name <> %(server_name)s)
+                        ON CONFLICT (server_name) DO UPDATE SET agent_host=excluded.agent_host, host=excluded.host, 
+                        port=excluded.port, last_seen=NOW()
+                    )
+                    SELECT server_name FROM old
+                """, params)
+                rows = cursor.fetchall()
+                if any(row[0] != data['server_name'] for row in rows):
+                    if len(rows) == 1:
+                        server_name = rows[0][0]
                         if len(utils.findDCSInstallations(server_name)) == 0:
                             self.log.info(f"Auto-renaming server \"{server_name}\" to \"{data['server_name']}\"")
                             server.rename(data['server_name'])
@@ -615,10 +655,10 @@ class DCSServerBot(commands.Bot):
                                 f"Registration of server \"{data['server_name']}\" aborted due to UDP port conflict.")
                             del self.servers[data['server_name']]
                             return False
-                cursor.execute('INSERT INTO servers (server_name, agent_host, host, port) VALUES(%s, %s, %s, '
-                               '%s) ON CONFLICT (server_name) DO UPDATE SET agent_host=excluded.agent_host, '
-                               'host=excluded.host, port=excluded.port, last_seen=NOW()',
-                               (data['server_name'], platform.node(), data['host'], data['port']))
+                    cursor.execute('INSERT INTO servers (server_name, agent_host, host, port) VALUES(%(server_name)s, '
+                                   '%(agent_host)s, %(host)s, %(port)s) ON CONFLICT (server_name) DO UPDATE SET '
+                                   'agent_host=excluded.agent_host, host=excluded.host, port=excluded.port, '
+                                   'last_seen=NOW()', params)
                 conn.commit()
         except (Exception, psycopg2.DatabaseError) as error:
             self.log.exception(error)
@@ -658,80 +698,84 @@ class DCSServerBot(commands.Bot):
         return None
 
     async def start_udp_listener(self):
-        class RequestHandler(BaseRequestHandler):
-
-            def handle(s):
-                data = json.loads(s.request[0].strip())
-                # ignore messages not containing server names
-                if 'server_name' not in data:
-                    self.log.warning('Message without server_name received: {}'.format(data))
-                    return
-                self.log.debug('{}->HOST: {}'.format(data['server_name'], json.dumps(data)))
-                if 'channel' in data and data['channel'].startswith('sync-'):
-                    if data['channel'] in self.listeners:
-                        f = self.listeners[data['channel']]
-                        if not f.done():
-                            self.loop.call_soon_threadsafe(f.set_result, data)
-                        if data['command'] != 'registerDCSServer':
-                            return
-                server_name = data['server_name']
-                if server_name not in s.server.message_queue:
-                    s.server.message_queue[server_name] = Queue()
-                    s.server.executor.submit(s.process, server_name)
-                s.server.message_queue[server_name].put(data)
-
-            def process(s, server_name: str):
-                data = s.server.message_queue[server_name].get()
-                server: Server = self.servers[server_name]
-                while len(data):
+        class DCSProtocol(asyncio.DatagramProtocol):
+
+            def __init__(s):
+                s.transport: Optional[asyncio.DatagramTransport] = None
+                s.message_queue: dict[str, asyncio.Queue[dict]] = {}
+                s.tasks: list[asyncio.Task] = []
+
+            def connection_made(s, transport: asyncio.DatagramTransport) -> None:
+                s.transport = transport
+
+            def datagram_received(s, message: bytes, addr: Tuple[str, int]) -> None:
+                # never let an exception escape, as this would close the transport
+                try:
+                    data = orjson.loads(message)
+                    # ignore messages not containing server names
+                    if 'server_name' not in data:
+                        self.log.warning('Message without server_name received: {}'.format(data))
+                        return
+                    self.log.debug('{}->HOST: {}'.format(data['server_name'], message.decode('utf-8')))
+                    channel = data.get('channel')
+                    if channel and channel.startswith('sync-'):
+                        f = self.listeners.get(channel)
+                        if f:
+                            if not f.done():
+                                f.set_result(data)
+                            if data['command'] != 'registerDCSServer':
+                                return
+                    server_name = data['server_name']
+                    if server_name not in s.message_queue:
+                        s.message_queue[server_name] = asyncio.Queue()
+                        s.tasks.append(asyncio.create_task(s.process(server_name)))
+                    s.message_queue[server_name].put_nowait(data)
+                except Exception as ex:
+                    self.log.exception(ex)
+
+            async def process(s, server_name: str):
+                queue = s.message_queue[server_name]
+                while True:
+                    data = await queue.get()
                     try:
                         command = data['command']
                         if command == 'registerDCSServer':
-                            if not self.register_server(data):
+                            # registration accesses the database, so keep it away from the event loop
+                            if not await asyncio.to_thread(self.register_server, data):
                                 self.log.error(f"Error while registering server {server_name}.")
-                                return
-                        elif server_name not in self.servers or server.status == Status.UNREGISTERED:
-                            self.log.debug(
-                                f"Command {command} for unregistered server {server_name} received, ignoring.")
-                            continue
-                        concurrent.futures.wait(
-                            [
-                                asyncio.run_coroutine_threadsafe(listener.processEvent(command, server, deepcopy(data)),
-                                                                 self.loop)
-                                for listener in self.eventListeners
-                                if listener.has_event(command)
-                            ]
-                        )
+                                continue
+                            server: Server = self.servers[server_name]
+                        else:
+                            server: Optional[Server] = self.servers.get(server_name)
+                            if not server or server.status is Status.UNREGISTERED:
+                                self.log.debug(
+                                    f"Command {command} for unregistered server {server_name} received, ignoring.")
+                                continue
+                        # run all listeners concurrently, a failing listener must not abort the others
+                        results = await asyncio.gather(*[
+                            listener.processEvent(command, server, deepcopy(data))
+                            for listener in self.eventListeners
+                            if listener.has_event(command)
+                        ], return_exceptions=True)
+                        for result in results:
+                            if isinstance(result, Exception):
+                                self.log.error(result, exc_info=result)
                     except Exception as ex:
                         self.log.exception(ex)
                     finally:
-                        s.server.message_queue[server_name].task_done()
-                        data = s.server.message_queue[server_name].get()
-
-        class MyThreadingUDPServer(ThreadingUDPServer):
-            def __init__(self, server_address: Tuple[str, int], request_handler: Callable[..., BaseRequestHandler],
-                         bot: DCSServerBot):
-                self.bot = bot
-                self.log = bot.log
-                self.executor = bot.executor
-                # enable reuse, in case the restart was too fast and the port was still in TIME_WAIT
-                MyThreadingUDPServer.allow_reuse_address = True
-                MyThreadingUDPServer.max_packet_size = 65504
-                self.message_queue: dict[str, Queue[str]] = {}
-                super().__init__(server_address, request_handler)
-
-            def shutdown(self) -> None:
-                super().shutdown()
+                        queue.task_done()
+
+            async def shutdown(s) -> None:
+                s.transport.close()
                 try:
-                    for server_name, queue in self.message_queue.items():
-                        if not queue.empty():
-                            queue.join()
-                        queue.put('')
+                    for queue in s.message_queue.values():
+                        await queue.join()
                 except Exception as ex:
                     self.log.exception(ex)
+                for task in s.tasks:
+                    task.cancel()
 
         host = self.config['BOT']['HOST']
         port = int(self.config['BOT']['PORT'])
-        self.udp_server = MyThreadingUDPServer((host, port), RequestHandler, self)
-        self.executor.submit(self.udp_server.serve_forever)
+        _, self.udp_server = await self.loop.create_datagram_endpoint(DCSProtocol, local_addr=(host, port))
         self.log.debug('- Listener started on interface {} port {} accepting commands.'.format(host, port))
@@ -1,12 +1,9 @@
 from __future__ import annotations
 import asyncio
 import discord
-import json
+import orjson
 import os
-import platform
-import psutil
 import psycopg2
-import socket
 import subprocess
 import uuid
 import win32con
@@ -82,6 +79,8 @@ class Server(DataObject):
 
     def __post_init__(self):
         super().__post_init__()
+        # the port is read from the configuration as a string
+        self.port = int(self.port)
         self._lock = asyncio.Lock()
         self.status_change = asyncio.Event()
         conn = self.pool.getconn()
@@ -263,13 +262,11 @@ class Server(DataObject):
     def sendtoDCS(self, message: dict):
         # As Lua does not support large numbers, convert them to strings
         for key, value in message.items():
-            if type(value) == int:
+            if type(value) is int:
                 message[key] = str(value)
-        msg = json.dumps(message)
-        self.log.debug(f"HOST->{self.name}: {msg}")
-        dcs_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        dcs_socket.sendto(msg.encode('utf-8'), (self.host, int(self.port)))
-        dcs_socket.close()
+        msg = orjson.dumps(message)
+        self.log.debug(f"HOST->{self.name}: {msg.decode('utf-8')}")
+        self.bot.udp_socket.sendto(msg, (self.host, self.port))
 
     async def sendtoDCSSync(self, message: dict, timeout: Optional[int] = 5.0):
         future = self.bot.loop.create_future()
@@ -370,9 +367,12 @@ class Server(DataObject):
             with suppress(asyncio.TimeoutError):
                 await self.wait_for_status_change([Status.STOPPED], timeout)
             if self.process and self.process.is_running():
-                try:
-                    self.process.wait(timeout)
-                except psutil.TimeoutExpired:
+                # poll instead of waiting in a thread, so that no executor thread is blocked for minutes
+                for _ in range(timeout):
+                    if not self.process.is_running():
+                        break
+                    await asyncio.sleep(1)
+                else:
                     self.process.kill()
         else:
             if self.process and self.process.is_running():
@@ -479,38 +479,52 @@ class Server(DataObject):
             if not message:
                 message = await channel.send(embed=embed, file=file)
                 self.embeds[embed_name] = message
-                conn = self.pool.getconn()
-                try:
-                    with closing(conn.cursor()) as cursor:
-                        cursor.execute('INSERT INTO message_persistence (server_name, embed_name, embed) VALUES (%s, '
-                                       '%s, %s) ON CONFLICT (server_name, embed_name) DO UPDATE SET '
-                                       'embed=excluded.embed', (self.name, embed_name, message.id))
-                    conn.commit()
-                except (Exception, psycopg2.DatabaseError) as error:
-                    self.log.exception(error)
-                    conn.rollback()
-                finally:
-                    self.pool.putconn(conn)
+                await asyncio.to_thread(self._persist_embed, embed_name, message.id)
+
+    def _persist_embed(self, embed_name: str, message_id: int) -> None:
+        conn = self.pool.getconn()
+        try:
+            with closing(conn.cursor()) as cursor:
+                cursor.execute('INSERT INTO message_persistence (server_name, embed_name, embed) VALUES (%s, '
+                               '%s, %s) ON CONFLICT (server_name, embed_name) DO UPDATE SET '
+                               'embed=excluded.embed', (self.name, embed_name, message_id))
+            conn.commit()
+        except (Exception, psycopg2.DatabaseError) as error:
+            self.log.exception(error)
+            conn.rollback()
+        finally:
+            self.pool.putconn(conn)
 
     def get_channel(self, channel: Channel) -> Optional[discord.TextChannel]:
         if channel not in self._channels:
             channel_id = self.bot.config[self.installation].get(channel.value)
             if not channel_id:
                 if channel == Channel.EVENTS:
-                    self._channels[channel] = self.get_channel(Channel.CHAT)
+                    _channel = self.get_channel(Channel.CHAT)
                 elif channel == Channel.COALITION_BLUE_EVENTS:
-                    self._channels[channel] = self.get_channel(Channel.COALITION_BLUE_CHAT)
+                    _channel = self.get_channel(Channel.COALITION_BLUE_CHAT)
                 elif channel == Channel.COALITION_RED_EVENTS:
-                    self._channels[channel] = self.get_channel(Channel.COALITION_RED_CHAT)
+                    _channel = self.get_channel(Channel.COALITION_RED_CHAT)
                 else:
                     self.log.warning(f"Channel {channel.name} has unknown ID {channel_id}. Please check.")
+                    self._channels[channel] = None
                     return None
             elif int(channel_id) != -1:
-                self._channels[channel] = self.bot.get_channel(int(channel_id))
+                _channel = self.bot.get_channel(int(channel_id))
             else:
+                self._channels[channel] = None
+                return None
+            # don't cache a miss, Discord might not be ready yet
+            if not _channel:
                 return None
+            self._channels[channel] = _channel
         return self._channels[channel]
 
+    def resolve_channels(self) -> None:
+        self._channels.clear()
+        for channel in Channel:
+            self.get_channel(channel)
+
     async def wait_for_status_change(self, status: list[Status], timeout: int = 60) -> None:
         async def wait(s: list[Status]):
             while self.status not in s:
@@ -523,20 +537,23 @@ class Server(DataObject):
         # we set a longer timeout in here because, we don't want to risk false restarts
         timeout = 50 if self.bot.config.getboolean('BOT', 'SLOW_SYSTEM') else 30
         data = await self.sendtoDCSSync({"command": "getMissionUpdate"}, timeout)
+        await asyncio.to_thread(self._update_last_seen)
+        if data['pause'] and self.status != Status.PAUSED:
+            self.status = Status.PAUSED
+        elif not data['pause'] and self.status != Status.RUNNING:
+            self.status = Status.RUNNING
+        self.current_mission.mission_time = data['mission_time']
+        self.current_mission.real_time = data['real_time']
+
+    def _update_last_seen(self) -> None:
         conn = self.pool.getconn()
         try:
             with closing(conn.cursor()) as cursor:
                 cursor.execute('UPDATE servers SET last_seen = NOW() WHERE agent_host = %s AND server_name = %s',
-                               (platform.node(), self.name))
+                               (self.bot.agent_host, self.name))
             conn.commit()
         except (Exception, psycopg2.DatabaseError) as error:
             self.log.exception(error)
             conn.rollback()
         finally:
             self.pool.putconn(conn)
-        if data['pause'] and self.status != Status.PAUSED:
-            self.status = Status.PAUSED
-        elif not data['pause'] and self.status != Status.RUNNING:
-            self.status = Status.RUNNING
-        self.current_mission.mission_time = data['mission_time']
-        self.current_mission.real_time = data['real_time']
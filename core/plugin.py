@@ -9,7 +9,6 @@ from copy import deepcopy
 from core import utils
 from discord.ext import commands
 from os import path
-from shutil import copytree
 from typing import Type, Optional, TYPE_CHECKING, Tuple
 from .listener import TEventListener
 
@@ -96,12 +95,12 @@ class Plugin(commands.Cog):
             elif version != self.plugin_version:
                 self.migrate(self.plugin_version)
                 self.set_installed_version(self.plugin_name, self.plugin_version)
-        for server in self.bot.servers.values():
-            source_path = f'./plugins/{self.plugin_name}/lua'
-            if path.exists(source_path):
+        source_path = f'./plugins/{self.plugin_name}/lua'
+        if path.exists(source_path):
+            for server in self.bot.servers.values():
                 target_path = path.expandvars(self.bot.config[server.installation]['DCS_HOME'] +
                                               f'\\Scripts\\net\\DCSServerBot\\{self.plugin_name}\\')
-                copytree(source_path, target_path, dirs_exist_ok=True)
+                utils.sync_tree(source_path, target_path)
                 self.log.debug(f'  => Luas installed into {server.installation}')
         # create report directories for convenience
         source_path = f'./plugins/{self.plugin_name}/reports'
@@ -21,24 +21,49 @@ REGEXP = {
 UPDATER_URL = 'https://www.digitalcombatsimulator.com/gameapi/updater/branch/{}/'
 
 
+# server names read from serverSettings.lua, keyed by path and only re-read if the file was modified
+_server_names: dict[str, Tuple[float, str]] = {}
+
+
+def _read_server_name(path: str) -> str:
+    mtime = os.path.getmtime(path)
+    cached = _server_names.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        settings = luadata.read(path, encoding='utf-8')
+    except Exception:
+        # DSMC workaround
+        settings = utils.alternate_parse_settings(path)
+    name = settings.get('name', 'DCS Server')
+    _server_names[path] = (mtime, name)
+    return name
+
+
+# installation (directory name) per server name, as found by the last scan
+_installations: dict[str, str] = {}
+
+
 def findDCSInstallations(server_name: Optional[str] = None) -> List[Tuple[str, str]]:
+    if server_name:
+        # check the last known installation of this server first, before scanning all of them
+        dirname = _installations.get(server_name)
+        if dirname:
+            path = os.path.join(SAVED_GAMES, dirname, 'Config\\serverSettings.lua')
+            if os.path.exists(path) and _read_server_name(path) == server_name:
+                return [(server_name, dirname)]
     installations = []
     for dirname in os.listdir(SAVED_GAMES):
         if os.path.isdir(os.path.join(SAVED_GAMES, dirname)):
             path = os.path.join(SAVED_GAMES, dirname, 'Config\\serverSettings.lua')
             if os.path.exists(path):
-                try:
-                    settings = luadata.read(path, encoding='utf-8')
-                except Exception:
-                    # DSMC workaround
-                    settings = utils.alternate_parse_settings(path)
-                if 'name' not in settings:
-                    settings['name'] = 'DCS Server'
+                name = _read_server_name(path)
+                _installations[name] = dirname
                 if server_name:
-                    if settings['name'] == server_name:
+                    if name == server_name:
                         return [(server_name, dirname)]
                 else:
-                    installations.append((settings['name'], dirname))
+                    installations.append((name, dirname))
     return installations
 
 
@@ -1,7 +1,9 @@
 import aiohttp
 import asyncio
 import ipaddress
+import os
 import psutil
+import shutil
 import socket
 from contextlib import closing, suppress
 
@@ -33,3 +35,19 @@ def find_process(proc, installation):
                     if installation in c.replace('\\', '/').split('/'):
                         return p
     return None
+
+
+def sync_tree(src: str, dst: str) -> None:
+    # like shutil.copytree(dirs_exist_ok=True), but only copies files that were changed
+    os.makedirs(dst, exist_ok=True)
+    for entry in os.scandir(src):
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            sync_tree(entry.path, target)
+            continue
+        stat = entry.stat()
+        with suppress(FileNotFoundError):
+            target_stat = os.stat(target)
+            if target_stat.st_size == stat.st_size and target_stat.st_mtime >= stat.st_mtime:
+                continue
+        shutil.copy2(entry.path, target)
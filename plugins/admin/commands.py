@@ -671,7 +671,7 @@ class AdminMaster(AdminAgent):
         @discord.ui.select(placeholder="Which age to be pruned?", options=[
             SelectOption(label='Older than 90 days', value='90'),
             SelectOption(label='Older than 180 days', value='180', default=True),
-            SelectOption(label='Older than 1 year', value='360 days')
+            SelectOption(label='Older than 1 year', value='360')
         ])
         async def set_age(self, interaction: Interaction, select: Select):
             self.age = select.values[0]
@@ -715,11 +715,11 @@ class AdminMaster(AdminAgent):
         try:
             with closing(conn.cursor()) as cursor:
                 if view.what in ['users', 'non-members']:
-                    sql = f"SELECT ucid FROM players WHERE last_seen < (DATE(NOW()) - interval '{view.age} days')"
+                    sql = "SELECT ucid FROM players WHERE last_seen < (DATE(NOW()) - %s * interval '1 day')"
                     if view.what == 'non-members':
                         sql += ' AND discord_id = -1'
 
-                    cursor.execute(sql)
+                    cursor.execute(sql, (int(view.age), ))
                     ucids = [row[0] for row in cursor.fetchall()]
                     if not ucids:
                         await ctx.send('No players to prune.')
@@ -729,8 +729,7 @@ class AdminMaster(AdminAgent):
                         return
                     for plugin in self.bot.cogs.values():  # type: Plugin
                         await plugin.prune(conn, ucids=ucids)
-                    for ucid in ucids:
-                        cursor.execute('DELETE FROM players WHERE ucid = %s', (ucid, ))
+                    cursor.execute('DELETE FROM players WHERE ucid = ANY(%s)', (ucids, ))
                     await ctx.send(f"{len(ucids)} players pruned.")
                 elif view.what == 'data':
                     days = int(view.age)
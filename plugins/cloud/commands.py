@@ -6,6 +6,7 @@ import os
 import pandas as pd
 import platform
 import psycopg2
+import psycopg2.extras
 import shutil
 import ssl
 from contextlib import closing
@@ -186,10 +187,11 @@ class CloudHandlerMaster(CloudHandlerAgent):
         conn = self.pool.getconn()
         try:
             if self.config.get('dcs-ban', False):
+                bans: list[dict] = await self.get('bans')
                 with closing(conn.cursor()) as cursor:
-                    for ban in (await self.get('bans')):
-                        cursor.execute('INSERT INTO bans (ucid, banned_by, reason) VALUES (%s, %s, %s) '
-                                       'ON CONFLICT DO NOTHING', (ban['ucid'], self.plugin_name, ban['reason']))
+                    psycopg2.extras.execute_values(cursor, 'INSERT INTO bans (ucid, banned_by, reason) VALUES %s '
+                                                           'ON CONFLICT DO NOTHING',
+                                                   [(ban['ucid'], self.plugin_name, ban['reason']) for ban in bans])
                 conn.commit()
             if self.config.get('discord-ban', False):
                 bans: list[dict] = await self.get('discord-bans')
@@ -49,9 +49,8 @@ class CreditSystemMaster(CreditSystemAgent):
         self.log.debug('Pruning Creditsystem ...')
         with closing(conn.cursor()) as cursor:
             if ucids:
-                for ucid in ucids:
-                    cursor.execute('DELETE FROM credits WHERE player_ucid = %s', (ucid,))
-                    cursor.execute('DELETE FROM credits_log WHERE player_ucid = %s', (ucid,))
+                cursor.execute('DELETE FROM credits WHERE player_ucid = ANY(%s)', (ucids, ))
+                cursor.execute('DELETE FROM credits_log WHERE player_ucid = ANY(%s)', (ucids, ))
         self.log.debug('Creditsystem pruned.')
 
     def get_credits(self, ucid: str) -> list[dict]:
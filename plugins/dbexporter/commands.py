@@ -1,4 +1,3 @@
-import json
 import os
 import psycopg2
 from contextlib import closing
@@ -30,11 +29,17 @@ class DBExporter(Plugin):
             with closing(conn.cursor()) as cursor:
                 cursor.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public' AND "
                                "table_name not in ('pu_events_sdw', 'servers', 'message_persistence')")
-                for table in (x[0] for x in cursor.fetchall() if x[0] not in table_filter):
-                    cursor.execute(f'SELECT ROW_TO_JSON(t) FROM (SELECT * FROM {table}) t')
-                    if cursor.rowcount > 0:
-                        with open(f'export/{table}.json', 'w') as file:
-                            file.writelines([json.dumps(x[0]) + '\n' for x in cursor.fetchall()])
+                tables = [x[0] for x in cursor.fetchall() if x[0] not in table_filter]
+            for table in tables:
+                # stream the rows through a server-side cursor, so that large tables are never held in memory
+                with closing(conn.cursor(name=f'export_{table}')) as cursor:
+                    cursor.execute(f'SELECT ROW_TO_JSON(t)::TEXT FROM (SELECT * FROM {table}) t')
+                    rows = cursor.fetchmany(1000)
+                    if rows:
+                        with open(f'export/{table}.json', 'w', encoding='utf-8') as file:
+                            while rows:
+                                file.writelines(x[0] + '\n' for x in rows)
+                                rows = cursor.fetchmany(1000)
         except (Exception, psycopg2.DatabaseError) as error:
             self.log.exception(error)
         finally:
@@ -236,7 +236,7 @@ class GameMasterMaster(GameMasterAgent):
         self.log.debug('Pruning Gamemaster ...')
         with closing(conn.cursor()) as cursor:
             if days > 0:
-                cursor.execute(f"DELETE FROM campaigns WHERE stop < (DATE(NOW()) - interval '{days} days')")
+                cursor.execute("DELETE FROM campaigns WHERE stop < (DATE(NOW()) - %s * interval '1 day')", (days, ))
         self.log.debug('Gamemaster pruned.')
 
     @commands.command(description='Deprecated', hidden=True)
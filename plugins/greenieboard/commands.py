@@ -65,10 +65,10 @@ class GreenieBoardAgent(Plugin):
         self.log.debug('Pruning Greenieboard ...')
         with closing(conn.cursor()) as cursor:
             if ucids:
-                for ucid in ucids:
-                    cursor.execute('DELETE FROM greenieboard WHERE player_ucid = %s', (ucid,))
+                cursor.execute('DELETE FROM greenieboard WHERE player_ucid = ANY(%s)', (ucids, ))
             elif days > 0:
-                cursor.execute(f"DELETE FROM greenieboard WHERE time < (DATE(NOW()) - interval '{days} days')")
+                cursor.execute("DELETE FROM greenieboard WHERE time < (DATE(NOW()) - %s * interval '1 day')",
+                               (days, ))
         self.log.debug('Greenieboard pruned.')
 
     def rename(self, old_name: str, new_name: str):
@@ -51,7 +51,8 @@ class Mission(Plugin):
         self.log.debug('Pruning Mission ...')
         with closing(conn.cursor()) as cursor:
             if days > 0:
-                cursor.execute(f"DELETE FROM missions WHERE mission_end < (DATE(NOW()) - interval '{days} days')")
+                cursor.execute("DELETE FROM missions WHERE mission_end < (DATE(NOW()) - %s * interval '1 day')",
+                               (days, ))
         self.log.debug('Mission pruned.')
 
     @commands.command(description='Lists the registered DCS servers')
@@ -36,10 +36,10 @@ class MissionStatisticsMaster(MissionStatisticsAgent):
         self.log.debug('Pruning Missionstats ...')
         with closing(conn.cursor()) as cursor:
             if ucids:
-                for ucid in ucids:
-                    cursor.execute('DELETE FROM missionstats WHERE init_id = %s', (ucid,))
+                cursor.execute('DELETE FROM missionstats WHERE init_id = ANY(%s)', (ucids, ))
             elif days > 0:
-                cursor.execute(f"DELETE FROM missionstats WHERE time < (DATE(NOW()) - interval '{days} days')")
+                cursor.execute("DELETE FROM missionstats WHERE time < (DATE(NOW()) - %s * interval '1 day')",
+                               (days, ))
         self.log.debug('Missionstats pruned.')
 
     @commands.command(description='Display statistics about sorties', usage='[user] [period]')
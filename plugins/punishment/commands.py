@@ -1,6 +1,7 @@
 import asyncio
 import discord
 import psycopg2
+import psycopg2.extras
 
 from contextlib import closing, suppress
 from copy import deepcopy
@@ -258,10 +259,9 @@ class PunishmentMaster(PunishmentAgent):
         self.log.debug('Pruning Punishment ...')
         with closing(conn.cursor()) as cursor:
             if ucids:
-                for ucid in ucids:
-                    cursor.execute('DELETE FROM pu_events WHERE init_id = %s', (ucid,))
+                cursor.execute('DELETE FROM pu_events WHERE init_id = ANY(%s)', (ucids, ))
             elif days > 0:
-                cursor.execute(f"DELETE FROM pu_events WHERE time < (DATE(NOW()) - interval '{days} days')")
+                cursor.execute("DELETE FROM pu_events WHERE time < (DATE(NOW()) - %s * interval '1 day')", (days, ))
         self.log.debug('Punishment pruned.')
 
     def read_decay_config(self):
@@ -277,14 +277,14 @@ class PunishmentMaster(PunishmentAgent):
             self.log.debug('Punishment - Running decay.')
             conn = self.pool.getconn()
             try:
-                with closing(conn.cursor(cursor_factory=psycopg2.extras.DictCursor)) as cursor:
-                    for d in self.decay_config:
-                        cursor.execute("""
-                            UPDATE pu_events 
-                            SET points = ROUND((points * %s)::numeric, 2), decay_run = %s 
-                            WHERE time < (timezone('utc', now()) - interval '%s days') AND decay_run < %s
-                        """, (d['weight'], d['days'], d['days'], d['days']))
-                        cursor.execute("DELETE FROM pu_events WHERE points = 0")
+                with closing(conn.cursor()) as cursor:
+                    # the decay steps have to run in order, but they can be sent in one go
+                    psycopg2.extras.execute_batch(cursor, """
+                        UPDATE pu_events 
+                        SET points = ROUND((points * %s)::numeric, 2), decay_run = %s 
+                        WHERE time < (timezone('utc', now()) - %s * interval '1 day') AND decay_run < %s
+                    """, [(d['weight'], d['days'], d['days'], d['days']) for d in self.decay_config])
+                    cursor.execute("DELETE FROM pu_events WHERE points = 0")
                 conn.commit()
             except (Exception, psycopg2.DatabaseError) as error:
                 conn.rollback()
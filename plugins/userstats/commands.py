@@ -130,10 +130,10 @@ class UserStatisticsMaster(UserStatisticsAgent):
         self.log.debug('Pruning Userstats ...')
         with closing(conn.cursor()) as cursor:
             if ucids:
-                for ucid in ucids:
-                    cursor.execute('DELETE FROM statistics WHERE player_ucid = %s', (ucid, ))
+                cursor.execute('DELETE FROM statistics WHERE player_ucid = ANY(%s)', (ucids, ))
             elif days > 0:
-                cursor.execute(f"DELETE FROM statistics WHERE hop_off < (DATE(NOW()) - interval '{days} days')")
+                cursor.execute("DELETE FROM statistics WHERE hop_off < (DATE(NOW()) - %s * interval '1 day')",
+                               (days, ))
         self.log.debug('Userstats pruned.')
 
     @commands.command(brief='Shows player statistics',
@@ -73,17 +73,10 @@ class UserStatisticsEventListener(EventListener):
         """, (server.name,))
 
         cursor.execute("""
-            SELECT mission_id, player_ucid, slot 
-            FROM statistics 
-            WHERE mission_id IN (
-                SELECT id FROM missions WHERE server_name = %s
-            ) AND hop_off IS NULL
+            UPDATE statistics s SET hop_off = GREATEST(s.hop_on, m.mission_end)
+            FROM missions m
+            WHERE s.mission_id = m.id AND m.server_name = %s AND s.hop_off IS NULL
         """, (server.name,))
-        for row in cursor.fetchall():
-            cursor.execute("""
-                UPDATE statistics SET hop_off = GREATEST(hop_on, (SELECT mission_end FROM missions WHERE id = %s))
-                WHERE mission_id = %s AND player_ucid = %s AND slot = %s AND hop_off IS NULL
-            """, (row[0], row[0], row[1], row[2]))
         cursor.execute("""
             UPDATE statistics SET hop_off = NOW() WHERE mission_id IN (
                 SELECT id FROM missions WHERE server_name = %s